@@ -1,5 +1,6 @@
 
 import os
+import mmap
 import yaml
 import json
 import requests
@@ -8,6 +9,30 @@ from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field
 from urllib.parse import urlparse
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Files at least this large are read through mmap instead of f.read().
+_MMAP_THRESHOLD = 1024 * 1024
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+_WHITESPACE = b' \t\r\n'
+
+
+def _load_yaml(stream) -> Any:
+    """Load YAML from a string, bytes or readable stream with the fastest safe loader."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+def _looks_like_json(data: Union[bytes, mmap.mmap]) -> bool:
+    """Sniff whether the content is JSON from its first non-whitespace byte."""
+    start = 3 if data[:3] == _UTF8_BOM else 0
+    length = len(data)
+    while start < length and data[start:start + 1] in _WHITESPACE:
+        start += 1
+    return data[start:start + 1] in (b'{', b'[')
+
+
 class OpenAPISpec(BaseModel):
     """Model representing an OpenAPI specification."""
     openapi: str
@@ -86,17 +111,36 @@ class OpenAPIParser:
         """Read and parse the specification from a file."""
         file_ext = self.spec_path.suffix.lower()
         
-        with open(self.spec_path, 'r') as f:
+        with open(self.spec_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._load_file_content(data, file_ext)
+            return self._load_file_content(f.read(), file_ext)
+    
+    def _load_file_content(self, data: Union[bytes, mmap.mmap], file_ext: str) -> Dict[str, Any]:
+        """Decode file content, sniffing the format when the extension is not conclusive."""
+        if file_ext in ['.yaml', '.yml']:
+            is_json = False
+        elif file_ext == '.json':
+            is_json = True
+        else:
+            is_json = _looks_like_json(data)
+        
+        if is_json:
+            try:
+                return json.loads(data[:] if isinstance(data, mmap.mmap) else data)
+            except json.JSONDecodeError:
+                # YAML flow mappings also start with '{' but are not valid JSON.
+                if file_ext == '.json':
+                    raise
+        
+        if isinstance(data, mmap.mmap):
+            # Let the loader pull from the mapping in chunks rather than copying it whole.
+            data.seek(0)
+        try:
+            return _load_yaml(data)
+        except yaml.YAMLError:
             if file_ext in ['.yaml', '.yml']:
-                return yaml.safe_load(f)
-            elif file_ext == '.json':
-                return json.load(f)
-            else:
-                content = f.read()
-                try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    try:
-                        return yaml.safe_load(content)
-                    except yaml.YAMLError:
-                        raise ValueError(f"Unsupported file format: {file_ext}")
+                raise
+            raise ValueError(f"Unsupported file format: {file_ext}")
@@ -6,8 +6,15 @@ import requests
 import yaml
 import json
 from pathlib import Path
+from clapikit import parser as parser_module
 from clapikit.parser import OpenAPIParser, OpenAPISpec
 
+SAMPLE_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Sample API", "version": "1.0.0"},
+    "paths": {"/users": {"get": {"operationId": "listUsers"}}},
+}
+
 class TestOpenAPIParser:
     """Test the OpenAPIParser class."""
     
@@ -62,3 +69,64 @@ class TestOpenAPIParser:
         with pytest.raises(ValueError):
             parser = OpenAPIParser("https://example.com/invalid-format")
             parser.parse()
+    
+    @pytest.mark.parametrize("filename, dump", [
+        ("openapi.yaml", yaml.safe_dump),
+        ("openapi.json", json.dumps),
+        ("openapi", json.dumps),
+        ("openapi", yaml.safe_dump),
+    ])
+    def test_parse_from_file(self, tmp_path, filename, dump):
+        """Test parsing YAML and JSON files, with and without an extension."""
+        spec_file = tmp_path / filename
+        spec_file.write_text(dump(SAMPLE_SPEC))
+        
+        spec = OpenAPIParser(spec_file).parse()
+        
+        assert spec.info["title"] == "Sample API"
+        assert "/users" in spec.paths
+    
+    def test_extensionless_yaml_skips_json(self, tmp_path, monkeypatch):
+        """Test that extensionless YAML is sniffed and not decoded as JSON first."""
+        def mock_json_loads(*args, **kwargs):
+            raise AssertionError("json.loads should not be called for YAML content")
+        
+        spec_file = tmp_path / "openapi"
+        spec_file.write_text(yaml.safe_dump(SAMPLE_SPEC))
+        monkeypatch.setattr(json, "loads", mock_json_loads)
+        
+        spec = OpenAPIParser(spec_file).parse()
+        
+        assert spec.openapi == "3.0.0"
+    
+    def test_extensionless_yaml_flow_mapping(self, tmp_path):
+        """Test that a YAML flow mapping that is not valid JSON still parses."""
+        spec_file = tmp_path / "openapi"
+        spec_file.write_text("{openapi: 3.0.0, info: {title: Flow, version: 1.0.0}, paths: {}}")
+        
+        spec = OpenAPIParser(spec_file).parse()
+        
+        assert spec.info["title"] == "Flow"
+    
+    @pytest.mark.parametrize("filename, dump", [
+        ("openapi.yaml", yaml.safe_dump),
+        ("openapi.json", json.dumps),
+        ("openapi", json.dumps),
+    ])
+    def test_parse_large_file_with_mmap(self, tmp_path, monkeypatch, filename, dump):
+        """Test that files above the mmap threshold are parsed from the mapping."""
+        spec_file = tmp_path / filename
+        spec_file.write_text(dump(SAMPLE_SPEC))
+        monkeypatch.setattr(parser_module, "_MMAP_THRESHOLD", 1)
+        
+        spec = OpenAPIParser(spec_file).parse()
+        
+        assert spec.paths["/users"]["get"]["operationId"] == "listUsers"
+    
+    def test_unsupported_file_format(self, tmp_path):
+        """Test that an undecodable extensionless file raises ValueError."""
+        spec_file = tmp_path / "openapi"
+        spec_file.write_text("key: [unclosed")
+        
+        with pytest.raises(ValueError):
+            OpenAPIParser(spec_file).parse()